@@ -21,6 +21,13 @@ export class TradingLambdaStack extends cdk.Stack {
 		// Or create a .env file in the trading-cdk directory and load it
 		const lambdaApiKey = process.env.LAMBDA_API_KEY || '';
 
+		// Optional RDS Proxy endpoint; when set, the Lambda connects through the proxy
+		// instead of directly to the host stored in the database secret
+		const rdsProxyEndpoint = process.env.RDS_PROXY_ENDPOINT || '';
+		// Set RDS_USE_PROXY=true instead when the database secret's host already points at
+		// RDS Proxy or PgBouncer
+		const rdsUseProxy = process.env.RDS_USE_PROXY || '';
+
 		if (!lambdaApiKey) {
 			console.warn(
 				'WARNING: LAMBDA_API_KEY is not set. Set it with: export LAMBDA_API_KEY=your-key'
@@ -44,7 +51,11 @@ export class TradingLambdaStack extends cdk.Stack {
 			'TradingLambdaFunction',
 			{
 				code: lambda.DockerImageCode.fromImageAsset(
-					path.join(__dirname, '../src/trading-lambda')
+					path.join(__dirname, '../src/trading-lambda'),
+					{
+						// Keep local-only files out of the Docker build context and asset hash
+						exclude: ['test.py', 'tests', '.env', '**/__pycache__', '**/*.pyc']
+					}
 				),
 				timeout: cdk.Duration.minutes(5),
 				memorySize: 256,
@@ -60,7 +71,9 @@ export class TradingLambdaStack extends cdk.Stack {
 				environment: {
 					// Add any environment variables here if needed
 					FASTAPI_BASE_URL: 'http://172.31.6.178:8888',
-					LAMBDA_API_KEY: lambdaApiKey
+					LAMBDA_API_KEY: lambdaApiKey,
+					RDS_PROXY_ENDPOINT: rdsProxyEndpoint,
+					RDS_USE_PROXY: rdsUseProxy
 				}
 			}
 		);
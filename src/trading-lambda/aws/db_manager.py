@@ -1,20 +1,122 @@
+import datetime
+import io
 import json
 import logging
+import os
+import random
+import threading
+import time
+import warnings
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID, uuid4
 
-import boto3
-import pandas as pd
 import psycopg2
 import psycopg2.extras
+import psycopg2.pool
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_REGION = os.environ.get("AWS_REGION", "us-east-1")
+
+# Refresh cached secrets hourly; the cache lives at module scope so it survives warm invocations
+SECRET_REFRESH_INTERVAL = 3600
+
+# Seconds between SELECT 1 liveness probes of a pooled connection (plus up to
+# PROBE_JITTER seconds so concurrent containers don't probe in lockstep)
+PROBE_INTERVAL = 30
+PROBE_JITTER = 5
+
+# boto3 and the secrets cache are imported on first connect() rather than at module
+# import, keeping them out of the cold-start import graph
+
+
+@lru_cache(maxsize=None)
+def _get_secretsmanager_client(region_name: str):
+    """Get the shared Secrets Manager client for a region (created once per container)."""
+    import boto3
+
+    return boto3.client("secretsmanager", region_name=region_name)
+
+
+@lru_cache(maxsize=None)
+def _get_secret_cache(region_name: str):
+    """Get the shared Secrets Manager cache for a region."""
+    from aws_secretsmanager_caching import SecretCache, SecretCacheConfig
+
+    return SecretCache(
+        config=SecretCacheConfig(secret_refresh_interval=SECRET_REFRESH_INTERVAL),
+        client=_get_secretsmanager_client(region_name),
+    )
+
+
+def _to_positional(statement: str) -> str:
+    """Convert %s placeholders to the $1, $2, ... form PREPARE expects."""
+    parts = statement.split("%s")
+    positional = parts[0]
+    for index, part in enumerate(parts[1:], start=1):
+        positional += f"${index}{part}"
+    return positional
+
+
+# Types whose str() is the literal Postgres parses back from CSV. Anything else (lists,
+# dicts, bytes, psycopg2 adapters such as Json) needs psycopg2's own adaptation, so it
+# has to go through INSERT; exact types only, since subclasses (e.g. str enums) may
+# override __str__
+COPY_TYPES = frozenset(
+    {str, int, float, bool, Decimal, UUID, datetime.date, datetime.datetime, datetime.time}
+)
+
+
+def can_copy(rows: List[Tuple]) -> bool:
+    """Whether every value in rows can be loaded through copy_from()."""
+    return all(
+        value is None or type(value) in COPY_TYPES for row in rows for value in row
+    )
+
+
+def _csv_field(value: Any) -> str:
+    """Quote every non-NULL value so only NULL is written as an unquoted empty field."""
+    if value is None:
+        return ""
+    if type(value) not in COPY_TYPES:
+        raise TypeError(
+            f"Cannot COPY a value of type {type(value).__name__}; use execute_values() instead"
+        )
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+class ConnectionLostError(psycopg2.OperationalError):
+    """The connection was closed while running a statement (raised from the original error)."""
+
+
+class _PooledConnection(psycopg2.extensions.connection):
+    """psycopg2 connection carrying the manager's per-connection state."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Session settings are applied on first checkout
+        self.initialized = False
+        # Names of the statements PREPAREd on this connection so far
+        self.prepared_statements = set()
+        self.last_probe_ts = time.monotonic()
+        self.probe_interval = PROBE_INTERVAL + random.uniform(0, PROBE_JITTER)
+        # Checkout slot of the pool this connection was borrowed from
+        self.slots: Optional[threading.BoundedSemaphore] = None
+
 
 class RDSConnectionManager:
     """
     Manages connections to an RDS PostgreSQL database using credentials from AWS Secrets Manager.
 
+    Connections come from a thread-safe pool of up to max_connections, so the manager can be
+    shared across threads; each call borrows a connection and returns it when done. When all
+    connections are in use, callers wait up to connect_timeout seconds for one to be returned.
+    Within a thread, queries run inside a transaction or while iterating stream() reuse that
+    connection rather than waiting for another.
+
     Example usage:
         # Basic usage
         db = RDSConnectionManager(secret_name='/quantecho/trading-cluster-secret-postgre', database='ibkr')
@@ -25,16 +127,25 @@ class RDSConnectionManager:
         # Using context manager (recommended)
         with RDSConnectionManager(secret_name='/quantecho/trading-cluster-secret-postgre', database='ibkr') as db:
             results = db.query("SELECT * FROM trades")
+
+    Behind RDS Proxy (or PgBouncer in transaction mode), pass the proxy endpoint as host,
+    set use_prepared_statements=False and keep autocommit=True: session-scoped PREPAREs
+    and open transactions pin the client to one backend and defeat the proxy's pooling.
     """
 
     def __init__(
         self,
         secret_name: str,
         database: Optional[str] = None,
-        region_name: str = "us-east-1",
+        region_name: str = DEFAULT_REGION,
         autocommit: bool = True,
         connect_timeout: int = 10,
         connect_instant: bool = False,
+        prepared_statements: Optional[Dict[str, str]] = None,
+        use_prepared_statements: bool = True,
+        host: Optional[str] = None,
+        statement_timeout: Optional[int] = None,
+        max_connections: int = 1,
     ):
         """
         Initialize the RDS connection manager.
@@ -45,6 +156,14 @@ class RDSConnectionManager:
             region_name: AWS region for Secrets Manager
             autocommit: Whether to autocommit transactions
             connect_timeout: Connection timeout in seconds
+            prepared_statements: Mapping of statement name to SQL (with %s placeholders);
+                run them with execute_prepared(), which PREPAREs each on first use per connection
+            use_prepared_statements: Whether to PREPARE prepared_statements server-side; when
+                False, execute_prepared() runs the registered SQL directly
+            host: Host to connect to instead of the secret's host (e.g. an RDS Proxy endpoint)
+            statement_timeout: Server-side statement timeout in milliseconds
+            max_connections: Maximum number of pooled connections; further concurrent
+                callers wait up to connect_timeout for one to be returned
         """
         self.secret_name = secret_name
         self.database = database
@@ -53,30 +172,39 @@ class RDSConnectionManager:
         # Increase default timeout for Lambda cold starts and VPC networking
         self.connect_timeout = connect_timeout if connect_timeout > 10 else 30
 
-        self.connection: Optional[psycopg2.extensions.connection] = None
-        self._db_config: Optional[Dict[str, Any]] = None
+        self.prepared_statements = prepared_statements or {}
+        self.use_prepared_statements = use_prepared_statements
+        self.host = host
+        self.statement_timeout = statement_timeout
+        self.max_connections = max_connections
+
+        self.pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+        # ThreadedConnectionPool.getconn() raises instead of blocking when exhausted, so
+        # checkouts first take one of max_connections slots (recreated with each pool)
+        self._slots = threading.BoundedSemaphore(max_connections)
+        # Guards pool creation/teardown so concurrent callers can't build two pools
+        self._pool_lock = threading.Lock()
+        # Connection pinned to a thread for a transaction, stream() or connection() block
+        self._local = threading.local()
 
         if connect_instant:
             self.connect()
 
     def _get_secret(self) -> Dict[str, Any]:
-        """Retrieve database credentials from AWS Secrets Manager."""
-        if self._db_config is not None:
-            return self._db_config
-
+        """Retrieve database credentials from AWS Secrets Manager (cached)."""
         try:
             logger.info(f"Retrieving secret from Secrets Manager: {self.secret_name}")
-            client = boto3.client("secretsmanager", region_name=self.region_name)
-            response = client.get_secret_value(SecretId=self.secret_name)
-            secret_string = response.get("SecretString")
+            secret_string = _get_secret_cache(self.region_name).get_secret_string(
+                self.secret_name
+            )
 
             if not secret_string:
                 raise ValueError(f"Secret {self.secret_name} has no SecretString")
 
-            self._db_config = json.loads(secret_string)
+            db_config = json.loads(secret_string)
             logger.info(f"Successfully retrieved secret: {self.secret_name}")
-            logger.debug(f"Secret contains keys: {list(self._db_config.keys())}")
-            return self._db_config
+            logger.debug(f"Secret contains keys: {list(db_config.keys())}")
+            return db_config
 
         except Exception as e:
             logger.error(f"Error retrieving secret {self.secret_name}: {e}")
@@ -88,72 +216,214 @@ class RDSConnectionManager:
 
     def connect(self) -> None:
         """
-        Establish connection to the RDS database.
+        Open the connection pool to the RDS database.
 
         Raises:
             Exception: If connection fails
         """
-        if self.connection and not self.connection.closed:
-            logger.warning("Connection already established")
-            return
+        with self._pool_lock:
+            if self.is_connected():
+                logger.debug("Connection already established")
+                return
 
-        try:
-            config = self._get_secret()
+            try:
+                config = self._get_secret()
 
-            # Log connection attempt (without password)
-            logger.info(
-                f"Attempting to connect to RDS host: {config.get('host')}, port: {config.get('port', 5432)}"
-            )
+                host = self.host or config["host"]
 
-            connection_params = {
-                "host": config["host"],
-                "port": config.get("port", 5432),
-                "user": config["username"],
-                "password": config["password"],
-                "connect_timeout": self.connect_timeout,
-            }
+                # Log connection attempt (without password)
+                logger.info(
+                    f"Attempting to connect to RDS host: {host}, port: {config.get('port', 5432)}"
+                )
 
-            # Add database if specified
-            if self.database:
-                connection_params["dbname"] = self.database
+                connection_params = {
+                    "host": host,
+                    "port": config.get("port", 5432),
+                    "user": config["username"],
+                    "password": config["password"],
+                    "connect_timeout": self.connect_timeout,
+                }
 
-            logger.debug(
-                f"Connection parameters: host={connection_params['host']}, port={connection_params['port']}, user={connection_params['user']}, dbname={connection_params.get('dbname', 'default')}"
-            )
+                # Add database if specified
+                if self.database:
+                    connection_params["dbname"] = self.database
 
-            self.connection = psycopg2.connect(**connection_params)
-            self.connection.autocommit = self.autocommit
+                if self.statement_timeout:
+                    connection_params["options"] = (
+                        f"-c statement_timeout={self.statement_timeout}"
+                    )
 
-            db_info = f" to database '{self.database}'" if self.database else ""
-            logger.info(f"Successfully connected to RDS{db_info}")
+                logger.debug(
+                    f"Connection parameters: host={connection_params['host']}, port={connection_params['port']}, user={connection_params['user']}, dbname={connection_params.get('dbname', 'default')}"
+                )
+
+                self.pool = psycopg2.pool.ThreadedConnectionPool(
+                    1,
+                    self.max_connections,
+                    connection_factory=_PooledConnection,
+                    **connection_params,
+                )
+                self._slots = threading.BoundedSemaphore(self.max_connections)
+
+                db_info = f" to database '{self.database}'" if self.database else ""
+                logger.info(f"Successfully connected to RDS{db_info}")
 
-        except psycopg2.OperationalError as e:
-            logger.error(f"Failed to connect to RDS - Operational Error: {e}")
-            logger.error(
-                f"Host: {config.get('host') if 'config' in locals() else 'unknown'}, Port: {config.get('port', 5432) if 'config' in locals() else 'unknown'}"
+            except psycopg2.OperationalError as e:
+                logger.error(f"Failed to connect to RDS - Operational Error: {e}")
+                logger.error(
+                    f"Host: {config.get('host') if 'config' in locals() else 'unknown'}, Port: {config.get('port', 5432) if 'config' in locals() else 'unknown'}"
+                )
+                raise
+            except Exception as e:
+                logger.error(f"Failed to connect to RDS - Unexpected error: {e}")
+                logger.error(f"Error type: {type(e).__name__}")
+                import traceback
+
+                logger.error(f"Traceback: {traceback.format_exc()}")
+                raise
+
+    def _setup_connection(self, connection: _PooledConnection) -> None:
+        """Apply session settings on a new connection."""
+        connection.autocommit = self.autocommit
+        connection.initialized = True
+
+    def _prepare_statement(self, connection: _PooledConnection, name: str) -> None:
+        """PREPARE a registered statement on the connection the first time it is used there."""
+        if name in connection.prepared_statements:
+            return
+
+        cursor = None
+        try:
+            cursor = connection.cursor()
+            cursor.execute(
+                f"PREPARE {name} AS {_to_positional(self.prepared_statements[name])}"
             )
-            raise
+            if not self.autocommit:
+                connection.commit()
+            connection.prepared_statements.add(name)
+            logger.debug(f"Prepared statement: {name}")
         except Exception as e:
-            logger.error(f"Failed to connect to RDS - Unexpected error: {e}")
-            logger.error(f"Error type: {type(e).__name__}")
-            import traceback
-
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error(f"Error preparing statement {name}: {e}")
+            if not self.autocommit:
+                connection.rollback()
             raise
+        finally:
+            if cursor:
+                cursor.close()
 
     def disconnect(self) -> None:
-        """Close the database connection."""
-        if self.connection and not self.connection.closed:
-            try:
-                self.connection.close()
-                logger.info("Database connection closed")
-            except Exception as e:
-                logger.error(f"Error closing connection: {e}")
-        self.connection = None
+        """Close all pooled database connections."""
+        with self._pool_lock:
+            if self.pool and not self.pool.closed:
+                try:
+                    self.pool.closeall()
+                    logger.info("Database connection closed")
+                except Exception as e:
+                    logger.error(f"Error closing connection: {e}")
+            self.pool = None
+            self._local = threading.local()
 
     def is_connected(self) -> bool:
-        """Check if database connection is active."""
-        return self.connection is not None and not self.connection.closed
+        """Check if the connection pool is open."""
+        return self.pool is not None and not self.pool.closed
+
+    def _is_alive(self, connection: _PooledConnection) -> bool:
+        """
+        Probe the connection with SELECT 1 if it hasn't been checked within the probe interval.
+
+        connection.closed only reflects client-side state, so a connection the server or
+        network dropped while the Lambda was frozen still looks open. Probing at most every
+        ~30s lets us replace it up front instead of failing the next query; the hot path
+        pays nothing between probes.
+        """
+        if connection.closed:
+            return False
+        if time.monotonic() - connection.last_probe_ts < connection.probe_interval:
+            return True
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if not connection.autocommit:
+                connection.rollback()
+            connection.last_probe_ts = time.monotonic()
+            return True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            logger.warning(f"Connection probe failed, reconnecting: {e}")
+            return False
+
+    def _acquire(self) -> _PooledConnection:
+        """Borrow a live, set-up connection from the pool, waiting for a free one if needed."""
+        slots = self._slots
+        if not slots.acquire(timeout=self.connect_timeout):
+            raise psycopg2.pool.PoolError(
+                f"No free connection after {self.connect_timeout}s "
+                f"(max_connections={self.max_connections})"
+            )
+
+        try:
+            connection = self._getconn()
+        except Exception:
+            slots.release()
+            raise
+        connection.slots = slots
+        return connection
+
+    def _getconn(self) -> _PooledConnection:
+        """Take a live, set-up connection from the pool (the caller holds a slot)."""
+        # Discard stale idle connections until one passes the probe or the pool opens a new one
+        while True:
+            connection = self.pool.getconn()
+            if not connection.initialized or self._is_alive(connection):
+                break
+            self.pool.putconn(connection, close=True)
+
+        try:
+            if not connection.initialized:
+                self._setup_connection(connection)
+        except Exception:
+            self.pool.putconn(connection, close=True)
+            raise
+        return connection
+
+    def _release(self, connection: _PooledConnection) -> None:
+        """Return a borrowed connection to the pool, discarding it if it is closed."""
+        try:
+            if connection.slots is not self._slots:
+                # Borrowed from a pool that has since been closed by disconnect()
+                connection.close()
+            elif self.is_connected():
+                self.pool.putconn(connection, close=bool(connection.closed))
+        finally:
+            connection.slots.release()
+
+    def _thread_connection(self) -> Optional[_PooledConnection]:
+        """Get the connection pinned to this thread by a transaction, stream() or get_connection()."""
+        for attr in ("connection", "scoped_connection", "held_connection"):
+            connection = getattr(self._local, attr, None)
+            if connection is not None:
+                return connection
+        return None
+
+    @contextmanager
+    def _checkout(self) -> Iterator[_PooledConnection]:
+        """Yield this thread's pinned connection, or borrow one from the pool for the call."""
+        if not self.is_connected():
+            raise ConnectionError("Not connected to database. Call connect() first.")
+
+        pinned = self._thread_connection()
+        connection = pinned if pinned is not None else self._acquire()
+        try:
+            yield connection
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            # Server-side errors such as QueryCanceledError or LockNotAvailable are also
+            # OperationalErrors but leave the connection usable; only a closed one is lost
+            if connection.closed and not isinstance(e, ConnectionLostError):
+                raise ConnectionLostError(str(e)) from e
+            raise
+        finally:
+            if pinned is None:
+                self._release(connection)
 
     def query(
         self,
@@ -169,9 +439,11 @@ class RDSConnectionManager:
             query: SQL query string (use %s for parameter placeholders)
             params: Tuple of parameters for the query
             fetch: Whether to fetch and return results (True for SELECT, False for INSERT/UPDATE/DELETE)
+            return_pandas: Return a pandas DataFrame instead of a list of dictionaries
 
         Returns:
-            List of dictionaries for SELECT queries, None for other queries
+            List of dictionaries (or a DataFrame) for SELECT queries, None for other queries.
+            Rows are the cursor's RealDictRow objects (a dict subclass) returned without copying.
 
         Example:
             # SELECT query
@@ -184,15 +456,28 @@ class RDSConnectionManager:
                 fetch=False
             )
         """
-        if not self.is_connected():
-            raise ConnectionError("Not connected to database. Call connect() first.")
+        with self._checkout() as connection:
+            return self._query(connection, query, params, fetch, return_pandas)
 
+    def _query(
+        self,
+        connection: _PooledConnection,
+        query: str,
+        params: Optional[Tuple],
+        fetch: bool,
+        return_pandas: bool,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Run query() on an already checked-out connection."""
         cursor = None
         try:
-            # Use RealDictCursor to return results as dictionaries
-            cursor = self.connection.cursor(
-                cursor_factory=psycopg2.extras.RealDictCursor
-            )
+            if fetch and return_pandas:
+                # Plain tuple cursor; the DataFrame is built straight from the rows
+                cursor = connection.cursor()
+            else:
+                # Use RealDictCursor to return results as dictionaries
+                cursor = connection.cursor(
+                    cursor_factory=psycopg2.extras.RealDictCursor
+                )
             cursor.execute(query, params or ())
 
             if fetch:
@@ -201,13 +486,17 @@ class RDSConnectionManager:
                     f"Query executed successfully, fetched {len(results)} rows"
                 )
                 if return_pandas:
-                    return pd.DataFrame([dict(row) for row in results])
-                else:
-                    return [dict(row) for row in results]
+                    # pandas is only needed here, so keep it off the cold-start import path
+                    import pandas as pd
+
+                    columns = [column.name for column in cursor.description]
+                    return pd.DataFrame.from_records(results, columns=columns)
+                # RealDictRow is a dict subclass, so rows are returned as-is
+                return results
             else:
                 affected_rows = cursor.rowcount
                 if not self.autocommit:
-                    self.connection.commit()
+                    connection.commit()
                 logger.debug(
                     f"Query executed successfully, affected {affected_rows} rows"
                 )
@@ -216,22 +505,141 @@ class RDSConnectionManager:
         except Exception as e:
             logger.error(f"Error executing query: {e}")
             if not self.autocommit:
-                self.connection.rollback()
+                connection.rollback()
             raise
         finally:
             if cursor:
                 cursor.close()
 
-    def execute_many(self, query: str, params_list: List[Tuple]) -> int:
+    def execute_prepared(
+        self,
+        name: str,
+        params: Optional[Tuple] = None,
+        fetch: bool = True,
+        return_pandas: bool = False,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Execute a statement registered through prepared_statements.
+
+        The statement is PREPAREd on a connection the first time it runs there, so
+        repeated calls skip the parser/planner and unused statements cost nothing.
+
+        Example:
+            db = RDSConnectionManager(
+                secret_name, prepared_statements={"q_trades": "SELECT * FROM trades WHERE symbol = %s"}
+            )
+            results = db.execute_prepared("q_trades", ('AAPL',))
+        """
+        if name not in self.prepared_statements:
+            raise ValueError(f"Unknown prepared statement: {name}")
+
+        if not self.use_prepared_statements:
+            return self.query(
+                self.prepared_statements[name],
+                params,
+                fetch=fetch,
+                return_pandas=return_pandas,
+            )
+
+        params = tuple(params or ())
+        placeholders = f"({', '.join(['%s'] * len(params))})" if params else ""
+        with self._checkout() as connection:
+            self._prepare_statement(connection, name)
+            return self._query(
+                connection,
+                f"EXECUTE {name}{placeholders}",
+                params,
+                fetch,
+                return_pandas,
+            )
+
+    def stream(
+        self,
+        query: str,
+        params: Optional[Tuple] = None,
+        chunk_size: int = 10000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the results of a SELECT query through a server-side cursor.
+
+        Rows are fetched from the server chunk_size at a time, so peak memory stays
+        bounded regardless of the size of the result set. Prefer this over query()
+        for large reads.
+
+        Args:
+            query: SQL query string (use %s for parameter placeholders)
+            params: Tuple of parameters for the query
+            chunk_size: Number of rows fetched from the server per round-trip
+
+        Yields:
+            One dictionary per row
+
+        Example:
+            for row in db.stream("SELECT * FROM trades WHERE symbol = %s", ('AAPL',)):
+                process(row)
+        """
+        # The connection stays checked out until iteration finishes
+        with self._checkout() as connection:
+            # Pin it so queries the caller runs while iterating reuse it instead of
+            # waiting for another one (which never frees up with max_connections=1)
+            pins_connection = self._thread_connection() is None
+            if pins_connection:
+                self._local.scoped_connection = connection
+
+            # Named (server-side) cursors only exist inside a transaction; open one
+            # unless we are already inside the caller's transaction
+            owns_transaction = connection.autocommit
+            if owns_transaction:
+                connection.autocommit = False
+
+            cursor = None
+            failed = False
+            try:
+                cursor = connection.cursor(
+                    name=f"stream_{uuid4().hex}",
+                    cursor_factory=psycopg2.extras.RealDictCursor,
+                )
+                cursor.itersize = chunk_size
+                cursor.execute(query, params or ())
+
+                for row in cursor:
+                    yield row
+
+            except Exception as e:
+                failed = True
+                logger.error(f"Error streaming query: {e}")
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
+                if owns_transaction and not connection.closed:
+                    # End the transaction (also when the caller stops iterating early),
+                    # committing writes the loop body made on the pinned connection;
+                    # a dropped connection has nothing to end and must not mask the real error
+                    if failed:
+                        connection.rollback()
+                    else:
+                        connection.commit()
+                    connection.autocommit = True
+                if pins_connection:
+                    self._local.scoped_connection = None
+
+    def execute_many(
+        self, query: str, params_list: List[Tuple], page_size: int = 100
+    ) -> int:
         """
         Execute a query multiple times with different parameters (bulk insert/update).
 
+        Statements are sent in pages of page_size per round-trip rather than one
+        round-trip per parameter tuple.
+
         Args:
             query: SQL query string
             params_list: List of parameter tuples
+            page_size: Number of statements sent per round-trip
 
         Returns:
-            Number of affected rows
+            Number of parameter tuples executed
 
         Example:
             data = [
@@ -244,52 +652,175 @@ class RDSConnectionManager:
                 data
             )
         """
-        if not self.is_connected():
-            raise ConnectionError("Not connected to database. Call connect() first.")
+        with self._checkout() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                psycopg2.extras.execute_batch(
+                    cursor, query, params_list, page_size=page_size
+                )
 
-        cursor = None
-        try:
-            cursor = self.connection.cursor()
-            affected_rows = cursor.executemany(query, params_list)
+                if not self.autocommit:
+                    connection.commit()
 
-            if not self.autocommit:
-                self.connection.commit()
+                logger.debug(
+                    f"Bulk query executed successfully, executed {len(params_list)} statements"
+                )
+                return len(params_list)
+
+            except Exception as e:
+                logger.error(f"Error executing bulk query: {e}")
+                if not self.autocommit:
+                    connection.rollback()
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
 
-            logger.debug(
-                f"Bulk query executed successfully, affected {affected_rows} rows"
+    def execute_values(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[Tuple],
+        page_size: int = 1000,
+        statement_type: str = "INSERT",
+    ) -> int:
+        """
+        Bulk insert rows with a single multi-row VALUES statement per page.
+
+        Args:
+            table: Target table name
+            columns: Column names, in the same order as each row tuple
+            rows: List of row tuples
+            page_size: Maximum number of rows sent per statement
+
+        Returns:
+            Number of rows sent
+
+        Example:
+            db.execute_values(
+                "trades",
+                ["symbol", "quantity", "price"],
+                [('AAPL', 100, 150.25), ('MSFT', 75, 310.75)],
             )
-            return affected_rows
+        """
+        query = f"{statement_type} INTO {table} ({', '.join(columns)}) VALUES %s"
 
-        except Exception as e:
-            logger.error(f"Error executing bulk query: {e}")
-            if not self.autocommit:
-                self.connection.rollback()
-            raise
-        finally:
-            if cursor:
-                cursor.close()
+        with self._checkout() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                psycopg2.extras.execute_values(cursor, query, rows, page_size=page_size)
+
+                if not self.autocommit:
+                    connection.commit()
+
+                logger.debug(f"Bulk insert executed successfully, sent {len(rows)} rows")
+                return len(rows)
+
+            except Exception as e:
+                logger.error(f"Error executing bulk insert: {e}")
+                if not self.autocommit:
+                    connection.rollback()
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
+
+    def copy_from(self, table: str, columns: List[str], rows: List[Tuple]) -> int:
+        """
+        Bulk load rows with COPY ... FROM STDIN, streaming them as in-memory CSV.
+
+        Much faster than INSERT for large batches. None is written as an unquoted empty
+        field (COPY's CSV NULL); every other value is quoted, so empty strings and
+        strings like "\\N" load as text exactly as execute_values() would insert them.
+        Only scalar values are supported (see can_copy()); others raise TypeError.
+
+        Args:
+            table: Target table name
+            columns: Column names, in the same order as each row tuple
+            rows: List of row tuples
+
+        Returns:
+            Number of rows copied
+        """
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(",".join(_csv_field(value) for value in row) + "\n")
+        buffer.seek(0)
+
+        query = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)"
+
+        with self._checkout() as connection:
+            cursor = None
+            try:
+                cursor = connection.cursor()
+                cursor.copy_expert(query, buffer)
+
+                if not self.autocommit:
+                    connection.commit()
+
+                logger.debug(f"COPY executed successfully, copied {cursor.rowcount} rows")
+                return cursor.rowcount
+
+            except Exception as e:
+                logger.error(f"Error executing COPY: {e}")
+                if not self.autocommit:
+                    connection.rollback()
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
+
+    def _pinned_connection(self) -> _PooledConnection:
+        """Get the connection pinned to this thread by begin_transaction()."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            raise ConnectionError("No transaction in progress. Call begin_transaction() first.")
+        return connection
+
+    def _unpin(self) -> None:
+        """Return this thread's transaction connection to the pool."""
+        connection = self._pinned_connection()
+        self._local.connection = None
+        if not connection.closed:
+            connection.autocommit = self.autocommit
+        # A connection held through get_connection() stays with the thread
+        if connection is not getattr(self._local, "held_connection", None):
+            self._release(connection)
 
     def begin_transaction(self) -> None:
-        """Begin a transaction (useful when autocommit=False)."""
+        """
+        Begin a transaction. The current thread keeps one pooled connection until
+        commit() or rollback(), so every query in between runs in the same transaction.
+        """
         if not self.is_connected():
             raise ConnectionError("Not connected to database.")
-        # In PostgreSQL, transactions begin implicitly or with explicit BEGIN
-        if self.connection.autocommit:
-            self.connection.autocommit = False
+        if getattr(self._local, "connection", None) is None:
+            # A stream() running in this thread keeps its own connection, so this borrows
+            # another one and the stream's cursor is unaffected by commit() or rollback()
+            connection = getattr(self._local, "held_connection", None) or self._acquire()
+            # In PostgreSQL, transactions begin implicitly or with explicit BEGIN
+            connection.autocommit = False
+            self._local.connection = connection
         logger.debug("Transaction started")
 
     def commit(self) -> None:
         """Commit the current transaction."""
-        if not self.is_connected():
-            raise ConnectionError("Not connected to database.")
-        self.connection.commit()
+        try:
+            self._pinned_connection().commit()
+        finally:
+            self._unpin()
         logger.debug("Transaction committed")
 
     def rollback(self) -> None:
         """Rollback the current transaction."""
-        if not self.is_connected():
-            raise ConnectionError("Not connected to database.")
-        self.connection.rollback()
+        connection = self._pinned_connection()
+        try:
+            if not connection.closed:
+                connection.rollback()
+        finally:
+            self._unpin()
         logger.debug("Transaction rolled back")
 
     @contextmanager
@@ -303,28 +834,60 @@ class RDSConnectionManager:
                 db.query("UPDATE accounts ...", fetch=False)
                 # Automatically commits if no exception, rolls back on error
         """
+        self.begin_transaction()
         try:
-            if self.autocommit:
-                self.connection.autocommit(False)
-            self.begin_transaction()
             yield self
-            self.commit()
         except Exception as e:
             self.rollback()
             logger.error(f"Transaction rolled back due to error: {e}")
             raise
-        finally:
-            if self.autocommit:
-                self.connection.autocommit(True)
+        self.commit()
+
+    @contextmanager
+    def connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Borrow the underlying psycopg2 connection for the duration of the block.
+        Use with caution - prefer using query() methods.
+
+        Manager calls made in the block from the same thread run on this connection.
+
+        Example:
+            with db.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+        """
+        with self._checkout() as connection:
+            pins_connection = self._thread_connection() is None
+            if pins_connection:
+                self._local.scoped_connection = connection
+            try:
+                yield connection
+            finally:
+                if pins_connection:
+                    self._local.scoped_connection = None
 
     def get_connection(self) -> psycopg2.extensions.connection:
         """
         Get the underlying psycopg2 connection object.
         Use with caution - prefer using query() methods.
+
+        Deprecated: use the connection() context manager. The connection returned here
+        stays checked out to the calling thread (and is used by its queries) until
+        disconnect(), so it occupies one of max_connections.
         """
+        warnings.warn(
+            "get_connection() is deprecated; use the connection() context manager",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         if not self.is_connected():
             raise ConnectionError("Not connected to database.")
-        return self.connection
+
+        connection = self._thread_connection()
+        if connection is None:
+            connection = self._acquire()
+            self._local.held_connection = connection
+        return connection
 
     def __enter__(self):
         """Context manager entry - automatically connects."""
@@ -335,7 +898,3 @@ class RDSConnectionManager:
         """Context manager exit - automatically disconnects."""
         self.disconnect()
         return False
-
-    def __del__(self):
-        """Destructor - ensure connection is closed."""
-        self.disconnect()
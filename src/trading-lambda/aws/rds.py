@@ -1,82 +1,149 @@
-from aws.db_manager import RDSConnectionManager
+import re
+import threading
+
 from constants import constants
 
+# Hot queries, PREPAREd on first use per connection so Postgres parses and plans them only once
+PREPARED_STATEMENTS = {
+    # Columns are cast in SQL so rows come back as float/int without Python-side conversion
+    "q_account_snapshot": """
+    select
+        (select mid from live_prices where contract_id = %s and security_type = 'IND'
+         order by quote_timestamp desc limit 1)::double precision as spx,
+        (select mid from live_prices where contract_id = %s and security_type = 'IND'
+         order by quote_timestamp desc limit 1)::double precision as vix,
+        COALESCE((select sum(p.quantity * p.multiplier * (lp.mid - p.open_price))
+         from positions p left join live_prices lp
+         on p.contract_id = lp.contract_id
+         where p.account = %s and p.status = 'open'), 0)::double precision as unrealized_pl,
+        (select COALESCE(sum(abs(quantity)), 0)
+         from positions where account = %s and status = 'open')::bigint as gross_positions,
+        (select COUNT(DISTINCT contract_id)
+         from positions where account = %s and status = 'open') as unique_contracts
+    """,
+}
+
+# Server-side statement timeout in milliseconds, applied only behind a proxy so a
+# pinned or stuck session can't hold a pooled backend indefinitely
+STATEMENT_TIMEOUT_MS = 5000
+
+# Pooled connections per container: the handler thread plus one worker thread
+# (capture_account_summary overlaps its snapshot query with the FastAPI call)
+MAX_CONNECTIONS = 2
+
 # Lazy-load RDS client to avoid connection attempts during module import
 _rds_client = None
+_rds_client_lock = threading.Lock()
 
 
 def _get_rds_client():
     """Get or create RDS client instance (lazy initialization)."""
     global _rds_client
-    if _rds_client is None:
-        _rds_client = RDSConnectionManager(constants.RDS_SECRET_NAME, database="ibkr")
+    if _rds_client is not None:
+        return _rds_client
+
+    with _rds_client_lock:
+        if _rds_client is None:
+            from aws.db_manager import RDSConnectionManager
+
+            _rds_client = RDSConnectionManager(
+                constants.RDS_SECRET_NAME,
+                database="ibkr",
+                host=constants.RDS_PROXY_ENDPOINT,
+                statement_timeout=(
+                    STATEMENT_TIMEOUT_MS if constants.RDS_USE_PROXY else None
+                ),
+                prepared_statements=PREPARED_STATEMENTS,
+                # Session-scoped PREPAREs pin RDS Proxy connections and fail under PgBouncer
+                # transaction pooling; autocommit stays on for the same reason
+                use_prepared_statements=not constants.RDS_USE_PROXY,
+                max_connections=MAX_CONNECTIONS,
+            )
     return _rds_client
 
 
-def execute(query_text, params=None, fetch=True):
+def _run(operation, retry=False):
+    """
+    Run operation(rds_client) on the shared pool.
+
+    With retry=True the operation is re-run once if the connection was lost mid-statement.
+    Only pass it for reads: a write may have committed before the connection dropped, and
+    replaying it would duplicate rows. Stale connections are already replaced by the
+    manager's liveness probe before a statement is sent, so writes don't need the retry
+    to survive a frozen container.
+    """
+    # Keep the pool open across warm invocations instead of paying the
+    # TCP/TLS/Postgres handshake on every call
     rds_client = _get_rds_client()
-    with rds_client:
-        return rds_client.query(
-            query_text, params=params, return_pandas=True, fetch=fetch
-        )
+    if not rds_client.is_connected():
+        rds_client.connect()
+
+    from aws.db_manager import ConnectionLostError
+
+    try:
+        return operation(rds_client)
+    except ConnectionLostError:
+        if not retry:
+            raise
+        # The manager discards closed connections, so the retry gets a fresh one
+        return operation(rds_client)
+
+
+def execute(query_text, params=None, fetch=True, return_pandas=False):
+    # fetch=True is used for SELECTs, which are safe to replay
+    return _run(
+        lambda rds_client: rds_client.query(
+            query_text, params=params, return_pandas=return_pandas, fetch=fetch
+        ),
+        retry=fetch,
+    )
 
 
-symbol_to_contract_id = {"SPX": "416904", "VIX": "13455763"}
+def execute_prepared(statement_name, params=None, return_pandas=False):
+    return _run(
+        lambda rds_client: rds_client.execute_prepared(
+            statement_name, params=params, return_pandas=return_pandas
+        ),
+        retry=True,
+    )
 
 
-def get_index_price(index_symbol: str):
-    if index_symbol not in symbol_to_contract_id:
-        raise ValueError(f"Invalid index symbol, Not implemented: {index_symbol}")
+# Row count at which INSERT batches of plain scalar values switch to COPY
+COPY_THRESHOLD = 500
 
-    query = f"""
-    select mid from live_prices where contract_id = '{symbol_to_contract_id[index_symbol]}' and security_type = 'IND'
-    order by quote_timestamp desc
-    limit 1
-    """
-    df = execute(query)
-    if df.empty:
-        return None
-    return df.iloc[0]["mid"]
-
-
-def get_gross_positions_and_unique_contracts(account_number: str):
-    query = """
-    select COALESCE(sum(abs(quantity)), 0) as gross_positions, COUNT(DISTINCT contract_id) as unique_contracts
-    from positions
-    where account = %s
-    and status = 'open'
-    """
+# Table/column names and statement types are interpolated into SQL, so only these are accepted
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+VALID_STATEMENT_TYPES = {"INSERT"}
 
-    df = execute(query, (str(account_number),))
+symbol_to_contract_id = {"SPX": "416904", "VIX": "13455763"}
 
-    if df.empty:
-        return 0, 0
-    gross_positions = df.iloc[0]["gross_positions"]
-    unique_contracts = df.iloc[0]["unique_contracts"]
-    return (
-        gross_positions if gross_positions is not None else 0,
-        unique_contracts if unique_contracts is not None else 0,
-    )
 
+def get_account_snapshot(account_number: str):
+    """Fetch SPX, VIX, unrealized P&L and position counts in a single round-trip."""
+    account_number = str(account_number)
+    rows = execute_prepared(
+        "q_account_snapshot",
+        (
+            symbol_to_contract_id["SPX"],
+            symbol_to_contract_id["VIX"],
+            account_number,
+            account_number,
+            account_number,
+        ),
+    )
+    return rows[0]
 
-def get_current_unrealized_pl(account_number: str):
-    query = """
-    select sum(p.quantity * p.multiplier * (lp.mid - p.open_price)) as unrealized_pl 
-    from positions p left join live_prices lp 
-    on p.contract_id = lp.contract_id 
-    where p.account = %s and p.status = 'open'
-    """
 
-    df = execute(query, (str(account_number),))
-    if df.empty:
-        return 0
-    return float(df.iloc[0]["unrealized_pl"])
+def _validate_identifier(identifier: str) -> str:
+    if not IDENTIFIER_PATTERN.fullmatch(identifier):
+        raise ValueError(f"Invalid SQL identifier: {identifier!r}")
+    return identifier
 
 
 def insert_or_update(
     table_name: str,
     data: dict,
-    attributes: list,
+    attributes: list = None,
     statement_type: str = "INSERT",
     return_query: bool = False,
 ):
@@ -86,22 +153,32 @@ def insert_or_update(
     if not data:
         return
 
-    # Build list of all values for parameterized query
-    all_values = []
-    for item in data:
-        for attr in attributes:
-            all_values.append(item.get(attr))
+    if attributes is None:
+        attributes = data[0].keys()
 
-    # Create placeholders for each row: (%s, %s, %s, ...)
-    num_cols = len(attributes)
-    placeholders_per_row = "(" + ", ".join(["%s"] * num_cols) + ")"
-
-    # Create placeholders for all rows: (%s, %s), (%s, %s), ...
-    all_placeholders = ", ".join([placeholders_per_row] * len(data))
-
-    query = f"{statement_type} INTO {table_name} ({', '.join(attributes)}) VALUES {all_placeholders}"
+    if statement_type not in VALID_STATEMENT_TYPES:
+        raise ValueError(f"Invalid statement type: {statement_type}")
+    _validate_identifier(table_name)
+    attributes = [_validate_identifier(attr) for attr in attributes]
+    rows = [tuple(item.get(attr) for attr in attributes) for item in data]
 
     if return_query:
-        return query, tuple(all_values)
+        # Runnable (query, params) pair with one placeholder group per row
+        placeholders_per_row = "(" + ", ".join(["%s"] * len(attributes)) + ")"
+        all_placeholders = ", ".join([placeholders_per_row] * len(rows))
+        query = f"{statement_type} INTO {table_name} ({', '.join(attributes)}) VALUES {all_placeholders}"
+        return query, tuple(value for row in rows for value in row)
+
+    from aws.db_manager import can_copy
+
+    # COPY only takes plain scalars; rows with lists, JSON, bytes etc. always go through
+    # execute_values so they are stored the same way whatever the batch size
+    if statement_type == "INSERT" and len(rows) >= COPY_THRESHOLD and can_copy(rows):
+        _run(lambda rds_client: rds_client.copy_from(table_name, attributes, rows))
+        return
 
-    execute(query, params=tuple(all_values), fetch=False)
+    _run(
+        lambda rds_client: rds_client.execute_values(
+            table_name, attributes, rows, statement_type=statement_type
+        )
+    )
@@ -1,12 +1,14 @@
 import os
 
-# Only load .env file for local testing (safe to call in Lambda - will just do nothing)
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    # dotenv not available, that's okay - we're in Lambda
-    pass
+# Only load .env file for local testing; Lambda never has one, so skip the import and
+# the filesystem search entirely there
+if not os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        # dotenv not installed locally, fall back to the process environment
+        pass
 
 
 class Constants:
@@ -14,6 +16,14 @@ class Constants:
     FASTAPI_BASE_URL = os.getenv("FASTAPI_BASE_URL")
     LAMBDA_API_KEY = os.getenv("LAMBDA_API_KEY")
     RDS_SECRET_NAME = "/quantecho/trading-cluster-secret-postgre"
+    # Optional RDS Proxy endpoint; when set it replaces the host from the secret
+    RDS_PROXY_ENDPOINT = os.getenv("RDS_PROXY_ENDPOINT") or None
+    # Connections go through RDS Proxy / PgBouncer (transaction mode): disables session-scoped
+    # PREPAREs and applies a statement timeout. Set RDS_USE_PROXY=true when the secret's host
+    # already points at the proxy; it is implied by RDS_PROXY_ENDPOINT.
+    RDS_USE_PROXY = (
+        os.getenv("RDS_USE_PROXY", "").lower() == "true" or RDS_PROXY_ENDPOINT is not None
+    )
 
 
 constants = Constants()
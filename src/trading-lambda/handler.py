@@ -1,28 +1,35 @@
-from methods.capture_account_summary import capture_account_summary
-from methods.refresh_orders import refresh_orders
-from methods.truncate_orders import truncate_orders
-from methods.update_contracts_table import update_contracts_table
+import importlib
+from functools import lru_cache
 
-VALID_METHODS = [
-    "update_contracts_table",
-    "capture_account_summary",
-    "refresh_orders",
-    "truncate_orders",
-]
+# method name -> (module, function); modules are imported on first use so a cold
+# start only pays for the method actually invoked
+_METHODS = {
+    "update_contracts_table": (
+        "methods.update_contracts_table",
+        "update_contracts_table",
+    ),
+    "capture_account_summary": (
+        "methods.capture_account_summary",
+        "capture_account_summary",
+    ),
+    "refresh_orders": ("methods.refresh_orders", "refresh_orders"),
+    "truncate_orders": ("methods.truncate_orders", "truncate_orders"),
+}
+
+VALID_METHODS = list(_METHODS)
+
+
+@lru_cache(maxsize=None)
+def _load(method):
+    module_name, function_name = _METHODS[method]
+    return getattr(importlib.import_module(module_name), function_name)
 
 
 def handler(event, context):
     """Lambda handler function - entry point for AWS Lambda."""
     method = event.get("method")
 
-    if method not in VALID_METHODS:
+    if method not in _METHODS:
         raise ValueError(f"Invalid method: {method}")
 
-    if method == "update_contracts_table":
-        return update_contracts_table(event)
-    elif method == "capture_account_summary":
-        return capture_account_summary(event)
-    elif method == "refresh_orders":
-        return refresh_orders(event)
-    elif method == "truncate_orders":
-        return truncate_orders(event)
+    return _load(method)(event)
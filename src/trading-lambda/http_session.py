@@ -0,0 +1,35 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from constants import constants
+
+# (connect, read) timeouts in seconds so a hung EC2 server can't hold the Lambda;
+# sized for quick calls, pass timeout= explicitly for long-running endpoints
+DEFAULT_TIMEOUT = (2, 10)
+
+# Shared across warm invocations so TCP connections to the FastAPI server are kept alive
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+_SESSION.headers[constants.LAMBDA_API_KEY_HEADER_NAME] = constants.LAMBDA_API_KEY
+
+
+def get(url, **kwargs):
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return _SESSION.get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return _SESSION.post(url, **kwargs)
+
+
+def patch(url, **kwargs):
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return _SESSION.patch(url, **kwargs)
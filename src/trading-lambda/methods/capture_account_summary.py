@@ -1,7 +1,8 @@
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 import aws.rds
-import requests
+import http_session
 from constants import constants
 
 
@@ -28,6 +29,7 @@ def parse_account_summary(account_summary):
 
 def capture_account_summary(event):
     account_number = event.get("account_number")
+    requested_account_number = account_number
 
     url = (
         constants.FASTAPI_BASE_URL
@@ -36,10 +38,17 @@ def capture_account_summary(event):
     )
 
     try:
-        response = requests.get(
-            url,
-            headers={constants.LAMBDA_API_KEY_HEADER_NAME: constants.LAMBDA_API_KEY},
-        )
+        # The DB snapshot only needs the account number, so when the event provides it
+        # the query runs while the FastAPI request is in flight. Only the worker thread
+        # touches the DB connection until both calls have finished.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            response_future = executor.submit(http_session.get, url)
+            snapshot_future = (
+                executor.submit(aws.rds.get_account_snapshot, account_number)
+                if account_number
+                else None
+            )
+            response = response_future.result()
 
         if response.status_code != 200:
             raise ValueError(f"Error capturing account summary: {response.text}")
@@ -47,8 +56,6 @@ def capture_account_summary(event):
         response_json = response.json()
 
         account_summary = response_json.get("account_summary")  # noqa
-        spx_price = aws.rds.get_index_price("SPX")
-        vix_price = aws.rds.get_index_price("VIX")
         account_history_snapshot = parse_account_summary(account_summary)
 
         if (
@@ -65,32 +72,14 @@ def capture_account_summary(event):
                 "account_summary": account_summary,
             }
 
-        unrealized_pl = aws.rds.get_current_unrealized_pl(account_number)
-
-        account_history_snapshot.update(
-            {
-                "spx": float(spx_price),
-                "vix": float(vix_price),
-                "unrealized_pl": unrealized_pl,
-            }
-        )
-
-        gross_positions, unique_contracts = (
-            aws.rds.get_gross_positions_and_unique_contracts(account_number)
-        )
-
-        account_history_snapshot.update(
-            {
-                "gross_positions": int(gross_positions or 0),
-                "unique_contracts": int(unique_contracts or 0),
-            }
-        )
+        if snapshot_future and account_number == requested_account_number:
+            snapshot = snapshot_future.result()
+        else:
+            snapshot = aws.rds.get_account_snapshot(account_number)
+        account_history_snapshot.update(snapshot)
 
         aws.rds.insert_or_update(
-            "account_history",
-            account_history_snapshot,
-            account_history_snapshot.keys(),
-            statement_type="INSERT",
+            "account_history", account_history_snapshot, statement_type="INSERT"
         )
 
         return {
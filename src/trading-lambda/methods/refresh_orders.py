@@ -1,9 +1,13 @@
 import traceback
 
 import aws.rds
-import requests
+import http_session
 from constants import constants
 
+# The refresh runs synchronously after the table is truncated, so give it well beyond
+# http_session.DEFAULT_TIMEOUT rather than time out and leave orders empty
+REFRESH_TIMEOUT = (2, 240)
+
 
 def refresh_orders(event):
     """ """
@@ -22,7 +26,7 @@ def refresh_orders(event):
         }
 
     try:
-        requests.patch(url, headers={constants.LAMBDA_API_KEY_HEADER_NAME: constants.LAMBDA_API_KEY})
+        http_session.patch(url, timeout=REFRESH_TIMEOUT)
     except Exception as e:
         print(f"Error refreshing orders: {e}")
         return {
@@ -1,6 +1,6 @@
 import traceback
 
-import requests
+import http_session
 from constants import constants
 
 
@@ -29,11 +29,7 @@ def update_contracts_table(event):
     }
 
     try:
-        response = requests.post(
-            url,
-            json=data,
-            headers={constants.LAMBDA_API_KEY_HEADER_NAME: constants.LAMBDA_API_KEY},
-        )
+        response = http_session.post(url, json=data)
     except Exception as e:
         print(f"Error updating contracts table: {traceback.format_exc()}")
         raise e
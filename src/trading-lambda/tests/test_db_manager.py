@@ -0,0 +1,36 @@
+import pytest
+from psycopg2.extras import Json
+
+from aws.db_manager import _csv_field, can_copy
+
+
+def test_csv_field_null_is_unquoted_empty():
+    assert _csv_field(None) == ""
+
+
+def test_csv_field_empty_string_is_quoted():
+    assert _csv_field("") == '""'
+
+
+def test_csv_field_backslash_n_stays_text():
+    assert _csv_field("\\N") == '"\\N"'
+
+
+def test_csv_field_escapes_embedded_quotes():
+    assert _csv_field('say "hi"') == '"say ""hi"""'
+
+
+def test_csv_field_scalars():
+    assert _csv_field(42) == '"42"'
+    assert _csv_field(1.5) == '"1.5"'
+
+
+@pytest.mark.parametrize("value", [["a", "b"], b"raw", {"a": 1}, Json({"a": 1})])
+def test_csv_field_rejects_non_scalars(value):
+    with pytest.raises(TypeError):
+        _csv_field(value)
+
+
+def test_can_copy():
+    assert can_copy([("a", None, 1), ("", 2.5, True)])
+    assert not can_copy([("a", ["b", "c"])])